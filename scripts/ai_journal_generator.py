@@ -6,12 +6,19 @@ Uses AI to transform raw git commits and Cursor activity into natural language
 journal entries that learn from your work patterns and understand accomplishments.
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
 import os
 import sqlite3
 import subprocess
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import re
@@ -34,25 +41,80 @@ try:
 except ImportError:
     HAS_OPENAI = False
 
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
+
+# Cache DB bounds: git log results kept per repo (current refs only) and AI entry lifetime
+COMMIT_CACHE_MAX_ROWS_PER_REPO = 50
+AI_CACHE_MAX_AGE_DAYS = 90
+
+# Project root, resolved once; all project paths are built from it so nothing needs os.chdir
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Stable instructions shared by every journal request. Keeping them out of the
+# per-day prompt lets the providers cache this prefix across days.
+SYSTEM_PROMPT = """You are helping me write my daily work journal.
+
+I want a natural, personal journal entry that:
+1. Understands what I actually accomplished (not just what I committed)
+2. Learns from my commit patterns to infer the bigger picture
+3. Reads like a personal reflection, not a technical report
+4. Connects my work to goals and accomplishments
+
+## Instructions
+
+Write a personal journal entry (2-3 paragraphs) that:
+
+1. **Understands accomplishments**: Look at the commits and infer what problems I was solving or features I was building. Don't just list commits - explain what I achieved.
+
+2. **Natural language**: Write in first person, like I'm reflecting on my day. Use phrases like "I worked on...", "I figured out...", "I made progress on..."
+
+3. **Connect the dots**: If I made multiple commits to the same feature, group them together. If I worked across multiple projects, explain how they relate.
+
+4. **Learning from patterns**: Notice patterns in commit messages - if I'm fixing bugs, building features, refactoring, etc. Reflect that in the narrative.
+
+5. **Personal tone**: This is MY journal. Make it feel authentic and reflective, not like a changelog.
+
+Example style:
+"Today I focused on improving the authentication system. I spent time debugging some edge cases that were causing issues for users, and then refactored the login flow to make it more robust. I also started exploring a new feature for the dashboard, though that's still in early stages."
+"""
+
 
 class AIJournalGenerator:
     """AI-powered journal generator that learns from commits and Cursor activity."""
     
     def __init__(self, config_path: str = "config/config.json"):
         """Initialize with configuration."""
-        script_dir = Path(__file__).parent.parent
-        os.chdir(script_dir)
-        
         self.config = self._load_config(config_path)
         self.workspace_root = Path(self.config["workspace_root"]).expanduser()
-        self.output_dir = script_dir / self.config["output_dir"]
-        self.cache_file = script_dir / self.config["cache_file"]
+        self.output_dir = PROJECT_ROOT / self.config["output_dir"]
+        
+        # Precompile exclusion matchers once instead of rebuilding them per path
+        exclude_fragments = [pattern.replace("**/", "").replace("/**", "")
+                             for pattern in self.config.get("exclude_patterns", [])]
+        self._exclude_re = re.compile("|".join(map(re.escape, exclude_fragments))) if exclude_fragments else None
+        self._exclude_names = frozenset(self.config.get("exclude_projects", []))
+        self._pruned_names = frozenset(exclude_fragments) | self._exclude_names
+        self.cache_file = PROJECT_ROOT / self.config["cache_file"]
+        self.cache_db_file = PROJECT_ROOT / self.config["cache_db_file"]
         
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_db_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Persistent cache DB (opened lazily, shared by the git worker threads)
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+        self._embedder = None
+        self._embedder_lock = threading.Lock()  # Days can embed from worker threads
         
         # AI client setup
         self.ai_client = self._setup_ai_client()
+        self._async_ai_client = None
         
         # Cursor paths
         self.cursor_dir = Path.home() / ".cursor"
@@ -60,6 +122,17 @@ class AIJournalGenerator:
         self.cursor_chats_dir = self.cursor_dir / "chats"
         self.cursor_tracking_db = self.cursor_dir / "ai-tracking" / "ai-code-tracking.db"
         
+        # Git subprocess settings: skip optional index/ref locks and only log my own commits
+        # (author_email: None = each repo's own user.email, "" = no author filter)
+        self._git_env = dict(os.environ, GIT_OPTIONAL_LOCKS="0")
+        self.author_email = self.config.get("author_email")
+        
+        # Long-lived read connection to the Cursor tracking DB (opened lazily)
+        self._cursor_db: Optional[sqlite3.Connection] = None
+        self._chat_db_cache: Dict[Tuple[str, float], bool] = {}
+        self._plan_files_by_day: Optional[Dict[date, List[Tuple[Path, datetime]]]] = None
+        atexit.register(self.close)
+        
         # Claude Code paths
         self.claude_dir = Path.home() / ".claude"
         self.claude_projects_dir = self.claude_dir / "projects"
@@ -68,8 +141,7 @@ class AIJournalGenerator:
         
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file."""
-        script_dir = Path(__file__).parent.parent
-        config_file = script_dir / config_path
+        config_file = PROJECT_ROOT / config_path
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
         
@@ -83,17 +155,26 @@ class AIJournalGenerator:
         config.setdefault("use_cursor_logs", True)
         config.setdefault("use_cursor_memory", True)
         
+        config.setdefault("ai_concurrency", 4)  # Max concurrent AI requests during backfills
+        config.setdefault("include_remotes", False)  # Also log remote-tracking branches
+        config.setdefault("use_ai_cache", True)
+        config.setdefault("semantic_cache_threshold", None)  # e.g. 0.95 to reuse near-identical days
+        
+        # cache_file is generate_daily_summary's JSON state (last run + git log cache), so cached data gets its own DB
+        config.setdefault("cache_db_file", "config/.journal_cache.db")
+        
         return config
     
-    def _setup_ai_client(self):
-        """Setup AI client based on config."""
+    def _setup_ai_client(self, use_async: bool = False):
+        """Setup AI client based on config (the async variant is used for date-range backfills)."""
         provider = self.config.get("ai_provider", "openai")
         
         if provider == "anthropic" and HAS_ANTHROPIC:
             api_key = os.getenv("ANTHROPIC_API_KEY") or self.config.get("anthropic_api_key")
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY not found. Set it in environment or config.")
-            return anthropic.Anthropic(api_key=api_key)
+            client_class = anthropic.AsyncAnthropic if use_async else anthropic.Anthropic
+            return client_class(api_key=api_key)
         
         elif provider == "openai" and HAS_OPENAI:
             # Check for DailyJournal-specific key first, then fallback to standard key
@@ -105,144 +186,421 @@ class AIJournalGenerator:
                     "OpenAI API key not found. Set DAILYJOURNAL_OPENAI_API_KEY or OPENAI_API_KEY "
                     "in environment, or openai_api_key in config."
                 )
-            return openai.OpenAI(api_key=api_key)
+            client_class = openai.AsyncOpenAI if use_async else openai.OpenAI
+            return client_class(api_key=api_key)
         
         else:
             raise ValueError(f"AI provider '{provider}' not available. Install anthropic or openai package.")
     
-    def get_git_commits(self, repo_path: Path, since_date: str, until_date: Optional[str] = None) -> List[Dict]:
-        """Get commits for a date range."""
+    def _get_cache_db(self) -> sqlite3.Connection:
+        """Open the persistent cache DB on first use."""
+        if self._cache_db is None:
+            conn = sqlite3.connect(str(self.cache_db_file), check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS commit_cache (
+                    repo TEXT,
+                    refs_sha TEXT,
+                    query TEXT,
+                    commits_json BLOB,
+                    PRIMARY KEY (repo, refs_sha, query)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ai_cache (
+                    key BLOB PRIMARY KEY,
+                    entry TEXT,
+                    created_at INTEGER,
+                    embedding TEXT
+                )
+            """)
+            conn.commit()
+            self._cache_db = conn
+        return self._cache_db
+    
+    def _get_git_user_email(self, repo_path: Path) -> Optional[str]:
+        """Get the author email to filter a repo's commits by (configured, or the repo's user.email)."""
+        if self.author_email is not None:
+            return self.author_email or None
         try:
-            os.chdir(repo_path)
+            # Resolved per repo so local and includeIf identities are honoured
+            result = subprocess.run(
+                ["git", "-C", str(repo_path), "config", "user.email"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                env=self._git_env
+            )
+            return result.stdout.strip() or None
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+    
+    def _get_cursor_db(self) -> Optional[sqlite3.Connection]:
+        """Open the Cursor tracking DB once and keep it for the rest of the run."""
+        if self._cursor_db is None and self.cursor_tracking_db.exists():
+            # The DB belongs to Cursor, so open it read-only
+            conn = sqlite3.connect(f"{self.cursor_tracking_db.as_uri()}?mode=ro", uri=True,
+                                   check_same_thread=False)
             
+            # The timestamp range query full-scans without an index. Only if one is missing,
+            # try to add it over a short-lived writable connection that gives up almost
+            # immediately rather than waiting on (or blocking) a running Cursor
+            if not self._has_timestamp_index(conn):
+                try:
+                    rw_conn = sqlite3.connect(str(self.cursor_tracking_db), timeout=0.1)
+                    try:
+                        rw_conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_code_hashes_ts ON ai_code_hashes(timestamp)")
+                        rw_conn.commit()
+                    finally:
+                        rw_conn.close()
+                except sqlite3.Error:
+                    pass
+            
+            # Read-side tuning only: leave Cursor's journal mode and sync settings alone
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA query_only=1")
+            conn.row_factory = sqlite3.Row
+            self._cursor_db = conn
+        return self._cursor_db
+    
+    def _has_timestamp_index(self, conn: sqlite3.Connection) -> bool:
+        """Check whether ai_code_hashes already has an index leading with timestamp."""
+        try:
+            for index in conn.execute("PRAGMA index_list(ai_code_hashes)").fetchall():
+                columns = conn.execute(f'PRAGMA index_info("{index[1]}")').fetchall()
+                if columns and columns[0][2] == "timestamp":
+                    return True
+        except sqlite3.Error:
+            pass
+        return False
+    
+    def close(self):
+        """Close any open database connections."""
+        for conn in (self._cursor_db, self._cache_db):
+            if conn is not None:
+                conn.close()
+        self._cursor_db = None
+        self._cache_db = None
+    
+    def _get_refs_sha(self, repo_path: Path) -> Optional[str]:
+        """Fingerprint the repo's refs so cached git log output can be reused safely."""
+        # git log walks every branch (and maybe remotes), so HEAD alone isn't enough to detect changes
+        if HAS_PYGIT2:
+            try:
+                repo = pygit2.Repository(str(repo_path))
+                refs = [f"{ref.target} {ref.name}" for ref in repo.references.iterator()]
+                refs.append(f"{repo.head.target} HEAD" if not repo.head_is_unborn else "HEAD")
+            except pygit2.GitError:
+                return None
+            return hashlib.sha1("\n".join(refs).encode()).hexdigest()
+        
+        result = subprocess.run(
+            ["git", "-C", str(repo_path), "show-ref", "--head"],
+            capture_output=True,
+            timeout=10,
+            env=self._git_env
+        )
+        if not result.stdout:
+            return None
+        return hashlib.sha1(result.stdout).hexdigest()
+    
+    def get_git_commits(self, repo_path: Path, since_date: str, until_date: Optional[str] = None,
+                        max_commits: Optional[int] = None) -> List[Dict]:
+        """Get commits for a date range."""
+        try:
+            # Only walk local branches; stale remotes and tags are opt-in
             cmd = [
-                "git", "log",
+                "git", "-C", str(repo_path), "log",
+                "--branches",
                 f"--since={since_date} 00:00:00",
-                "--all",
-                "--pretty=format:%h|%an|%ad|%s|%b",
+                "--pretty=format:%h%x1f%an%x1f%ad%x1f%ct%x1f%s%x1f%b%x1e",
                 "--date=iso",
                 "--no-merges"
             ]
             
+            if self.config.get("include_remotes", False):
+                cmd.insert(5, "--remotes")
+            
             if until_date:
                 cmd.insert(-2, f"--until={until_date} 23:59:59")
             
-            max_commits = self.config.get("max_commits_per_repo", 50)
+            author_email = self._get_git_user_email(repo_path)
+            if author_email:
+                cmd.insert(-2, f"--author={author_email}")
+            
+            if max_commits is None:
+                max_commits = self.config.get("max_commits_per_repo", 50)
             if max_commits:
                 cmd.extend(["-n", str(max_commits)])
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Check the persistent cache before running git log
+            refs_sha = self._get_refs_sha(repo_path)
+            query = " ".join(cmd[3:])
+            if refs_sha:
+                with self._cache_lock:
+                    row = self._get_cache_db().execute(
+                        "SELECT commits_json FROM commit_cache WHERE repo = ? AND refs_sha = ? AND query = ?",
+                        (str(repo_path), refs_sha, query)
+                    ).fetchone()
+                if row:
+                    return json.loads(row[0])
             
-            if result.returncode != 0:
+            # Walk in-process with libgit2 when available, otherwise run git log
+            if HAS_PYGIT2:
+                commits = self._walk_git_log(repo_path, since_date, until_date, max_commits, author_email)
+            else:
+                commits = self._run_git_log(cmd, repo_path)
+            if commits is None:
                 return []
             
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if not line or '|' not in line:
-                    continue
-                
-                parts = line.split('|', 4)
-                if len(parts) >= 4:
-                    commits.append({
-                        'hash': parts[0],
-                        'author': parts[1],
-                        'date': parts[2],
-                        'message': parts[3],
-                        'body': parts[4] if len(parts) > 4 else '',
-                        'repo': repo_path.name
-                    })
+            if refs_sha:
+                with self._cache_lock:
+                    db = self._get_cache_db()
+                    # Rows for older ref states can never match again, so drop them,
+                    # and keep only the most recent queries for the current refs
+                    db.execute(
+                        "DELETE FROM commit_cache WHERE repo = ? AND refs_sha != ?",
+                        (str(repo_path), refs_sha)
+                    )
+                    db.execute(
+                        "INSERT OR REPLACE INTO commit_cache (repo, refs_sha, query, commits_json) VALUES (?, ?, ?, ?)",
+                        (str(repo_path), refs_sha, query, json.dumps(commits))
+                    )
+                    db.execute(
+                        """DELETE FROM commit_cache WHERE repo = ? AND rowid NOT IN (
+                               SELECT rowid FROM commit_cache WHERE repo = ? ORDER BY rowid DESC LIMIT ?
+                           )""",
+                        (str(repo_path), str(repo_path), COMMIT_CACHE_MAX_ROWS_PER_REPO)
+                    )
+                    db.commit()
             
             return commits
         
         except Exception as e:
             print(f"⚠️  Error getting git log for {repo_path}: {e}")
             return []
+    
+    def _run_git_log(self, cmd: List[str], repo_path: Path) -> Optional[List[Dict]]:
+        """Run git log and parse its records, or return None if git fails."""
+        # Stream the log so memory stays bounded by one read chunk, not the whole log
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=self._git_env
+        )
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(10, kill_on_timeout)
+        timer.start()
+        
+        commits = []
+        try:
+            # Records end with the record separator; keep any partial record for the next chunk
+            pending = ''
+            for chunk in iter(lambda: proc.stdout.read(65536), ''):
+                *records, pending = (pending + chunk).split('\x1e')
+                for record in records:
+                    commit = self._parse_commit_record(record, repo_path)
+                    if commit:
+                        commits.append(commit)
+            proc.wait(timeout=10)
         finally:
-            os.chdir(self.workspace_root)
+            timer.cancel()
+            # Don't leave git running if parsing or the wait above raised
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        
+        if timed_out.is_set():
+            print(f"⚠️  git log timed out after 10s for {repo_path}")
+            return None
+        if proc.returncode != 0:
+            return None
+        return commits
+    
+    def _walk_git_log(self, repo_path: Path, since_date: str, until_date: Optional[str],
+                      max_commits: Optional[int], author_email: Optional[str] = None) -> Optional[List[Dict]]:
+        """Walk commits with pygit2 (no subprocess), mirroring the git log command's filters."""
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            branches = list(repo.branches.local)
+            if self.config.get("include_remotes", False):
+                branches += list(repo.branches.remote)
+            # Peel rather than read .target: symbolic refs like origin/HEAD target a ref name, not a commit
+            tips = [repo.branches[name].peel(pygit2.Commit).id for name in branches]
+        except (pygit2.GitError, KeyError):
+            return None
+        
+        if not tips:
+            return []
+        
+        since_ts = datetime.fromisoformat(since_date).timestamp()
+        until_ts = (datetime.fromisoformat(until_date) + timedelta(days=1)).timestamp() if until_date else None
+        
+        walker = repo.walk(tips[0], pygit2.GIT_SORT_TIME)
+        for tip in tips[1:]:
+            walker.push(tip)
+        
+        commits = []
+        for commit in walker:
+            # Time-sorted walk, so everything after this is older than --since
+            if commit.commit_time < since_ts:
+                break
+            if until_ts is not None and commit.commit_time >= until_ts:
+                continue
+            if len(commit.parent_ids) > 1:
+                continue
+            author = commit.author
+            if author_email and author_email not in f"{author.name} <{author.email}>":
+                continue
+            
+            subject, _, body = commit.message.partition('\n\n')
+            author_tz = timezone(timedelta(minutes=author.offset))
+            commits.append({
+                'hash': commit.short_id,
+                'author': author.name,
+                'date': datetime.fromtimestamp(author.time, author_tz).strftime("%Y-%m-%d %H:%M:%S %z"),
+                'commit_time': commit.commit_time,
+                'message': ' '.join(subject.split('\n')).strip(),
+                'body': body.strip(),
+                'repo': repo_path.name
+            })
+            if max_commits and len(commits) >= max_commits:
+                break
+        
+        return commits
+    
+    def _parse_commit_record(self, record: str, repo_path: Path) -> Optional[Dict]:
+        """Parse one git log record (fields split by the unit separator)."""
+        parts = record.lstrip('\n').split('\x1f', 5)
+        if len(parts) != 6:
+            return None
+        return {
+            'hash': parts[0],
+            'author': parts[1],
+            'date': parts[2],
+            'commit_time': int(parts[3]),
+            'message': parts[4],
+            'body': parts[5].strip(),
+            'repo': repo_path.name
+        }
+    
+    def _get_plan_files_by_day(self) -> Dict[date, List[Tuple[Path, datetime]]]:
+        """Scan the Cursor plans dir once per run and bucket plan files by modified day."""
+        if self._plan_files_by_day is None:
+            self._plan_files_by_day = defaultdict(list)
+            try:
+                # scandir hands back the stat info, so there's no second stat per file
+                with os.scandir(self.cursor_plans_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".plan.md"):
+                            continue
+                        try:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            mtime = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+                        except OSError:
+                            continue
+                        self._plan_files_by_day[mtime.date()].append((Path(entry.path), mtime))
+            except OSError:
+                pass
+        return self._plan_files_by_day
     
-    def get_cursor_plans(self, target_date: str) -> List[Dict]:
+    def get_cursor_plans(self, target_date: str, target_dt: Optional[datetime] = None) -> List[Dict]:
         """Get Cursor plan files for the date."""
         if not self.cursor_plans_dir.exists():
             return []
         
         plans = []
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+        target_dt = target_dt or datetime.fromisoformat(target_date)
         
-        for plan_file in self.cursor_plans_dir.glob("*.plan.md"):
-            try:
-                mtime = datetime.fromtimestamp(plan_file.stat().st_mtime)
-                if mtime.date() == target_dt.date():
-                    content = plan_file.read_text()
-                    plans.append({
-                        'file': plan_file.name,
-                        'path': str(plan_file),
-                        'content': content[:2000],  # First 2000 chars
-                        'modified': mtime.isoformat()
-                    })
-            except Exception as e:
-                print(f"⚠️  Error reading plan {plan_file}: {e}")
+        # Content is loaded lazily (see _read_plan_preview); only a few plans reach the prompt
+        for plan_file, mtime in self._get_plan_files_by_day().get(target_dt.date(), []):
+            plans.append({
+                'file': plan_file.name,
+                'path': str(plan_file),
+                'content': None,
+                'modified': mtime.isoformat()
+            })
         
         return plans
     
-    def get_cursor_activity(self, target_date: str) -> Dict:
+    def _read_plan_preview(self, plan: Dict, max_chars: int = 300) -> str:
+        """Read just the start of a plan file instead of loading the whole thing."""
+        if plan.get('content') is not None:
+            return plan['content'][:max_chars]
+        try:
+            with open(plan['path'], 'r') as f:
+                return f.read(max_chars)
+        except Exception as e:
+            print(f"⚠️  Error reading plan {plan['path']}: {e}")
+            return ''
+    
+    def get_cursor_activity(self, target_date: str, target_dt: Optional[datetime] = None) -> Dict:
         """Get Cursor AI activity from tracking database."""
         if not self.cursor_tracking_db.exists() or not self.config.get("use_cursor_logs", True):
             return {}
         
         activity = {
             'code_generated': [],
-            'files_touched': set(),
+            'files_touched': [],
             'conversations': []
         }
         
         try:
-            target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+            target_dt = target_dt or datetime.fromisoformat(target_date)
             start_ts = int(target_dt.timestamp())
             end_ts = int((target_dt + timedelta(days=1)).timestamp())
+            window = (start_ts * 1000, end_ts * 1000)
             
-            conn = sqlite3.connect(str(self.cursor_tracking_db))
-            cursor = conn.cursor()
+            conn = self._get_cursor_db()
             
-            # Get AI code generation tracking
-            cursor.execute("""
-                SELECT hash, source, fileName, fileExtension, timestamp, conversationId
+            # Get AI code generation tracking (same SQL every call, so the statement cache hits)
+            for row in conn.execute("""
+                SELECT hash, source, fileName, fileExtension, conversationId
                 FROM ai_code_hashes
                 WHERE timestamp >= ? AND timestamp < ?
-                ORDER BY timestamp DESC
-            """, (start_ts * 1000, end_ts * 1000))
-            
-            for row in cursor.fetchall():
+            """, window):
                 activity['code_generated'].append({
-                    'hash': row[0],
-                    'source': row[1],
-                    'file': row[2],
-                    'extension': row[3],
-                    'timestamp': row[4],
-                    'conversation_id': row[5]
+                    'hash': row['hash'],
+                    'source': row['source'],
+                    'file': row['fileName'],
+                    'extension': row['fileExtension'],
+                    'conversation_id': row['conversationId']
                 })
-                if row[2]:
-                    activity['files_touched'].add(row[2])
             
-            conn.close()
+            # Let SQLite dedupe the touched files via the timestamp index
+            activity['files_touched'] = [row['fileName'] for row in conn.execute("""
+                SELECT DISTINCT fileName
+                FROM ai_code_hashes
+                WHERE timestamp >= ? AND timestamp < ? AND fileName IS NOT NULL AND fileName != ''
+            """, window)]
             
         except Exception as e:
             print(f"⚠️  Error reading Cursor tracking: {e}")
         
-        activity['files_touched'] = list(activity['files_touched'])
         return activity
     
-    def get_cursor_chat_context(self, target_date: str) -> List[Dict]:
-        """Extract context from Cursor chat databases."""
+    def get_cursor_chat_context(self, target_date: str, end_date: Optional[str] = None) -> List[Dict]:
+        """
+        Extract context from Cursor chat databases.
+        Only sessions whose store.db was modified between target_date and end_date
+        (inclusive) are checked, so a range can be scanned once and bucketed by 'modified'.
+        """
         if not self.cursor_chats_dir.exists() or not self.config.get("use_cursor_memory", True):
             return []
         
         chats = []
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+        first_day = date.fromisoformat(target_date)
+        last_day = date.fromisoformat(end_date) if end_date else first_day
         
         # Scan chat databases for relevant conversations
         for chat_dir in self.cursor_chats_dir.iterdir():
@@ -251,44 +609,53 @@ class AIJournalGenerator:
             
             for session_dir in chat_dir.iterdir():
                 db_file = session_dir / "store.db"
-                if not db_file.exists():
+                try:
+                    mtime = os.stat(db_file).st_mtime
+                except OSError:
                     continue
                 
-                try:
-                    conn = sqlite3.connect(str(db_file))
-                    cursor = conn.cursor()
-                    
-                    # Try to get messages (schema may vary)
-                    try:
-                        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                        tables = [row[0] for row in cursor.fetchall()]
-                        
-                        # Look for message-like tables
-                        for table in tables:
-                            if 'message' in table.lower() or 'chat' in table.lower():
-                                cursor.execute(f"SELECT * FROM {table} LIMIT 5")
-                                # Just note that we have chat data
-                                chats.append({
-                                    'session': session_dir.name,
-                                    'has_data': True
-                                })
-                                break
-                    except:
-                        pass
-                    
-                    conn.close()
-                except:
-                    pass
+                modified = datetime.fromtimestamp(mtime)
+                if not first_day <= modified.date() <= last_day:
+                    continue
+                
+                # Probe each store.db only once per version of the file
+                cache_key = (str(db_file), mtime)
+                if cache_key not in self._chat_db_cache:
+                    self._chat_db_cache[cache_key] = self._chat_db_has_data(db_file)
+                
+                if self._chat_db_cache[cache_key]:
+                    # Just note that we have chat data
+                    chats.append({
+                        'session': session_dir.name,
+                        'has_data': True,
+                        'modified': modified.isoformat()
+                    })
         
         return chats
     
-    def get_claude_code_conversations(self, target_date: str) -> List[Dict]:
+    def _chat_db_has_data(self, db_file: Path) -> bool:
+        """Check whether a Cursor chat store.db has a non-empty message-like table."""
+        try:
+            conn = sqlite3.connect(str(db_file))
+            try:
+                # Schema may vary, so look for message-like tables
+                tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+                for table in tables:
+                    if 'message' in table.lower() or 'chat' in table.lower():
+                        return conn.execute(f'SELECT 1 FROM "{table}" LIMIT 1').fetchone() is not None
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        return False
+    
+    def get_claude_code_conversations(self, target_date: str, target_dt: Optional[datetime] = None) -> List[Dict]:
         """Get Claude Code conversation history from project JSONL files."""
         if not self.claude_projects_dir.exists() or not self.config.get("use_cursor_logs", True):
             return []
         
         conversations = []
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+        target_dt = target_dt or datetime.fromisoformat(target_date)
         
         try:
             # Find all JSONL files in project directories
@@ -361,13 +728,13 @@ class AIJournalGenerator:
         
         return conversations
     
-    def get_claude_code_todos(self, target_date: str) -> List[Dict]:
+    def get_claude_code_todos(self, target_date: str, target_dt: Optional[datetime] = None) -> List[Dict]:
         """Get Claude Code todos for the date."""
         if not self.claude_todos_dir.exists():
             return []
         
         todos = []
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+        target_dt = target_dt or datetime.fromisoformat(target_date)
         
         for todo_file in self.claude_todos_dir.glob("*.json"):
             try:
@@ -385,13 +752,13 @@ class AIJournalGenerator:
         
         return todos
     
-    def get_claude_code_plans(self, target_date: str) -> List[Dict]:
+    def get_claude_code_plans(self, target_date: str, target_dt: Optional[datetime] = None) -> List[Dict]:
         """Get Claude Code plan files for the date."""
         if not self.claude_plans_dir.exists():
             return []
         
         plans = []
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+        target_dt = target_dt or datetime.fromisoformat(target_date)
         
         for plan_file in self.claude_plans_dir.glob("*.md"):
             try:
@@ -409,32 +776,181 @@ class AIJournalGenerator:
         
         return plans
     
+    def _prepare_journal_request(self, target_date: str, commits: List[Dict],
+                                 plans: List[Dict], cursor_activity: Dict,
+                                 claude_conversations: List[Dict] = None,
+                                 claude_todos: List[Dict] = None,
+                                 claude_plans: List[Dict] = None) -> Tuple[str, str]:
+        """Build the AI prompt for a day and the cache key for its response."""
+        
+        # Get Claude Code data (unless the caller already collected it)
+        target_dt = datetime.fromisoformat(target_date)
+        if claude_conversations is None:
+            claude_conversations = self.get_claude_code_conversations(target_date, target_dt)
+        if claude_todos is None:
+            claude_todos = self.get_claude_code_todos(target_date, target_dt)
+        if claude_plans is None:
+            claude_plans = self.get_claude_code_plans(target_date, target_dt)
+        
+        # Prepare context for AI
+        context = self._prepare_ai_context(
+            target_date, commits, plans, cursor_activity,
+            claude_conversations, claude_todos, claude_plans
+        )
+        
+        # Create the prompt
+        return self._create_journal_prompt(context), self._ai_cache_key(context)
+    
     def generate_ai_journal_entry(self, target_date: str, commits: List[Dict], 
                                   plans: List[Dict], cursor_activity: Dict,
                                   claude_conversations: List[Dict] = None,
                                   claude_todos: List[Dict] = None,
                                   claude_plans: List[Dict] = None) -> str:
         """Use AI to generate a natural language journal entry."""
+        prompt, cache_key = self._prepare_journal_request(
+            target_date, commits, plans, cursor_activity,
+            claude_conversations, claude_todos, claude_plans
+        )
         
-        # Get Claude Code data
-        claude_conversations = self.get_claude_code_conversations(target_date)
-        claude_todos = self.get_claude_code_todos(target_date)
-        claude_plans = self.get_claude_code_plans(target_date)
+        # Reuse a previous entry if this exact context (or a near-identical one) was already sent
+        use_cache = self.config.get("use_ai_cache", True)
+        if use_cache:
+            cached_entry = self._get_cached_entry(cache_key, prompt)
+            if cached_entry is not None:
+                print("♻️  Reusing cached journal entry")
+                return cached_entry
         
-        # Prepare context for AI
-        context = self._prepare_ai_context(
+        # Call AI
+        if self.config.get("ai_provider") == "anthropic":
+            entry = self._call_anthropic(prompt)
+        else:
+            entry = self._call_openai(prompt)
+        
+        if use_cache:
+            self._store_cached_entry(cache_key, prompt, entry)
+        return entry
+    
+    async def generate_ai_journal_entry_async(self, target_date: str, commits: List[Dict],
+                                              plans: List[Dict], cursor_activity: Dict,
+                                              claude_conversations: List[Dict] = None,
+                                              claude_todos: List[Dict] = None,
+                                              claude_plans: List[Dict] = None) -> str:
+        """Async version of generate_ai_journal_entry, so backfill days can run concurrently."""
+        # File reads, SQLite and embedding are blocking, so run them off the event loop
+        # to keep the other days' requests in flight
+        prompt, cache_key = await asyncio.to_thread(
+            self._prepare_journal_request,
             target_date, commits, plans, cursor_activity,
             claude_conversations, claude_todos, claude_plans
         )
         
-        # Create the prompt
-        prompt = self._create_journal_prompt(context)
+        use_cache = self.config.get("use_ai_cache", True)
+        if use_cache:
+            cached_entry = await asyncio.to_thread(self._get_cached_entry, cache_key, prompt)
+            if cached_entry is not None:
+                print(f"♻️  Reusing cached journal entry for {target_date}")
+                return cached_entry
         
-        # Call AI
         if self.config.get("ai_provider") == "anthropic":
-            return self._call_anthropic(prompt)
+            entry = await self._call_anthropic_async(prompt)
         else:
-            return self._call_openai(prompt)
+            entry = await self._call_openai_async(prompt)
+        
+        if use_cache:
+            await asyncio.to_thread(self._store_cached_entry, cache_key, prompt, entry)
+        return entry
+    
+    def _ai_cache_key(self, context: Dict) -> str:
+        """Digest of everything that determines the AI response."""
+        payload = {
+            'provider': self.config.get("ai_provider"),
+            'model': self.config.get("ai_model"),
+            'temperature': self.config.get("ai_temperature"),
+            'system_prompt': SYSTEM_PROMPT,
+            'context': context
+        }
+        return hashlib.blake2b(
+            json.dumps(payload, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).hexdigest()
+    
+    def _get_embedder(self):
+        """Load the sentence-transformer model for semantic cache hits (optional)."""
+        with self._embedder_lock:
+            if self._embedder is None:
+                try:
+                    # Imported lazily: it pulls in torch, which is slow to load
+                    from sentence_transformers import SentenceTransformer
+                except ImportError:
+                    print("⚠️  semantic_cache_threshold is set but sentence-transformers is not installed")
+                    self._embedder = False
+                    return None
+                self._embedder = SentenceTransformer(
+                    self.config.get("semantic_cache_model", "all-MiniLM-L6-v2")
+                )
+        return self._embedder or None
+    
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed text for semantic cache lookups, or None when disabled."""
+        if not self.config.get("semantic_cache_threshold"):
+            return None
+        embedder = self._get_embedder()
+        if embedder is None:
+            return None
+        return embedder.encode(text, normalize_embeddings=True).tolist()
+    
+    def _get_cached_entry(self, cache_key: str, prompt: str) -> Optional[str]:
+        """Look up a cached journal entry by exact key, then by embedding similarity."""
+        try:
+            with self._cache_lock:
+                row = self._get_cache_db().execute(
+                    "SELECT entry FROM ai_cache WHERE key = ?", (cache_key,)
+                ).fetchone()
+            if row:
+                return row[0]
+            
+            query = self._embed(prompt)
+            if query is None:
+                return None
+            
+            threshold = self.config["semantic_cache_threshold"]
+            since = int(time.time()) - 30 * 86400
+            with self._cache_lock:
+                rows = self._get_cache_db().execute(
+                    "SELECT entry, embedding FROM ai_cache WHERE created_at >= ? AND embedding IS NOT NULL",
+                    (since,)
+                ).fetchall()
+            
+            best_entry, best_score = None, threshold
+            for entry, embedding in rows:
+                # Embeddings are normalized, so the dot product is the cosine similarity
+                score = sum(a * b for a, b in zip(query, json.loads(embedding)))
+                if score >= best_score:
+                    best_entry, best_score = entry, score
+            return best_entry
+        
+        except Exception as e:
+            print(f"⚠️  Error reading AI cache: {e}")
+            return None
+    
+    def _store_cached_entry(self, cache_key: str, prompt: str, entry: str):
+        """Save a generated journal entry to the AI cache."""
+        try:
+            embedding = self._embed(prompt)
+            with self._cache_lock:
+                db = self._get_cache_db()
+                now = int(time.time())
+                db.execute(
+                    "INSERT OR REPLACE INTO ai_cache (key, entry, created_at, embedding) VALUES (?, ?, ?, ?)",
+                    (cache_key, entry, now, json.dumps(embedding) if embedding else None)
+                )
+                db.execute(
+                    "DELETE FROM ai_cache WHERE created_at < ?",
+                    (now - AI_CACHE_MAX_AGE_DAYS * 86400,)
+                )
+                db.commit()
+        except Exception as e:
+            print(f"⚠️  Error writing AI cache: {e}")
     
     def _prepare_ai_context(self, target_date: str, commits: List[Dict], 
                            plans: List[Dict], cursor_activity: Dict,
@@ -444,17 +960,14 @@ class AIJournalGenerator:
         """Prepare structured context for AI."""
         
         # Group commits by repo
-        commits_by_repo = {}
+        commits_by_repo = defaultdict(list)
         for commit in commits:
-            repo = commit.get('repo', 'unknown')
-            if repo not in commits_by_repo:
-                commits_by_repo[repo] = []
-            commits_by_repo[repo].append(commit)
+            commits_by_repo[commit.get('repo', 'unknown')].append(commit)
         
         return {
             'date': target_date,
             'commits': commits,
-            'commits_by_repo': commits_by_repo,
+            'commits_by_repo': dict(commits_by_repo),
             'total_commits': len(commits),
             'cursor_plans': plans,
             'cursor_activity': cursor_activity,
@@ -467,15 +980,7 @@ class AIJournalGenerator:
     def _create_journal_prompt(self, context: Dict) -> str:
         """Create the AI prompt for journal generation."""
         
-        prompt = f"""You are helping me write my daily work journal. Today is {context['date']}.
-
-I want a natural, personal journal entry that:
-1. Understands what I actually accomplished (not just what I committed)
-2. Learns from my commit patterns to infer the bigger picture
-3. Reads like a personal reflection, not a technical report
-4. Connects my work to goals and accomplishments
-
-Here's what I did today:
+        prompt = f"""Today is {context['date']}. Here's what I did today:
 
 ## Git Commits ({context['total_commits']} total)
 
@@ -493,7 +998,7 @@ Here's what I did today:
         if context['cursor_plans']:
             prompt += f"\n## Cursor Plans ({len(context['cursor_plans'])} active)\n\n"
             for plan in context['cursor_plans'][:5]:
-                prompt += f"- {plan['file']}: {plan['content'][:300]}...\n"
+                prompt += f"- {plan['file']}: {self._read_plan_preview(plan)}...\n"
         
         # Add Cursor AI activity
         if context['cursor_activity'].get('code_generated'):
@@ -527,95 +1032,129 @@ Here's what I did today:
         
         prompt += """
 
-## Instructions
-
-Write a personal journal entry (2-3 paragraphs) that:
-
-1. **Understands accomplishments**: Look at the commits and infer what problems I was solving or features I was building. Don't just list commits - explain what I achieved.
-
-2. **Natural language**: Write in first person, like I'm reflecting on my day. Use phrases like "I worked on...", "I figured out...", "I made progress on..."
-
-3. **Connect the dots**: If I made multiple commits to the same feature, group them together. If I worked across multiple projects, explain how they relate.
-
-4. **Learning from patterns**: Notice patterns in commit messages - if I'm fixing bugs, building features, refactoring, etc. Reflect that in the narrative.
-
-5. **Personal tone**: This is MY journal. Make it feel authentic and reflective, not like a changelog.
-
-Example style:
-"Today I focused on improving the authentication system. I spent time debugging some edge cases that were causing issues for users, and then refactored the login flow to make it more robust. I also started exploring a new feature for the dashboard, though that's still in early stages."
-
 Write the journal entry now:"""
         
         return prompt
     
-    def _call_anthropic(self, prompt: str) -> str:
-        """Call Anthropic Claude API."""
+    def _anthropic_request(self, prompt: str) -> Dict:
+        """Build the Anthropic messages.create arguments."""
         model = self.config.get("ai_model", "claude-3-haiku-20240307")  # Fallback for Anthropic
         
-        message = self.ai_client.messages.create(
+        return dict(
             model=model,
             max_tokens=2000,
             temperature=self.config.get("ai_temperature", 0.7),
+            system=[{
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            }],
             messages=[{
                 "role": "user",
                 "content": prompt
             }]
         )
-        
-        return message.content[0].text
     
-    def _call_openai(self, prompt: str) -> str:
-        """Call OpenAI API."""
+    def _openai_request(self, prompt: str) -> Dict:
+        """Build the OpenAI chat.completions.create arguments."""
         model = self.config.get("ai_model", "gpt-5-mini")  # Latest generation default
         
-        response = self.ai_client.chat.completions.create(
+        # OpenAI caches long prompt prefixes automatically, so the static part goes first
+        return dict(
             model=model,
             messages=[{
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            }, {
                 "role": "user",
                 "content": prompt
             }],
             temperature=self.config.get("ai_temperature", 0.7),
             max_tokens=2000
         )
-        
+    
+    def _call_anthropic(self, prompt: str) -> str:
+        """Call Anthropic Claude API."""
+        message = self.ai_client.messages.create(**self._anthropic_request(prompt))
+        return message.content[0].text
+    
+    def _call_openai(self, prompt: str) -> str:
+        """Call OpenAI API."""
+        response = self.ai_client.chat.completions.create(**self._openai_request(prompt))
+        return response.choices[0].message.content
+    
+    def _get_async_ai_client(self):
+        """Create the async AI client on first use."""
+        if self._async_ai_client is None:
+            self._async_ai_client = self._setup_ai_client(use_async=True)
+        return self._async_ai_client
+    
+    async def _call_anthropic_async(self, prompt: str) -> str:
+        """Call Anthropic Claude API without blocking the event loop."""
+        message = await self._get_async_ai_client().messages.create(**self._anthropic_request(prompt))
+        return message.content[0].text
+    
+    async def _call_openai_async(self, prompt: str) -> str:
+        """Call OpenAI API without blocking the event loop."""
+        response = await self._get_async_ai_client().chat.completions.create(**self._openai_request(prompt))
         return response.choices[0].message.content
     
     def find_git_repos(self) -> List[Path]:
         """Find all git repositories."""
         repos = []
-        max_depth = 3
-        
-        try:
-            result = subprocess.run(
-                ["find", str(self.workspace_root), "-maxdepth", str(max_depth * 2),
-                 "-type", "d", "-name", ".git"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            for git_dir in result.stdout.strip().split('\n'):
-                if not git_dir:
-                    continue
-                repo_path = Path(git_dir).parent
-                if not self._should_exclude(repo_path):
-                    repos.append(repo_path)
+        max_depth = 3 * 2  # Same reach as the old `find -maxdepth 6`
         
-        except subprocess.TimeoutExpired:
-            print("⚠️  Find command timed out")
+        # Iterative scandir walk: prune excluded dir names before recursing into them
+        pruned_names = self._pruned_names
+        stack = [(str(self.workspace_root), 1)]
+        while stack:
+            dir_path, depth = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name == ".git":
+                            repos.append(Path(dir_path))
+                            continue
+                        if entry.name in pruned_names or depth >= max_depth:
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((entry.path, depth + 1))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
         
-        excluded = set(self.config.get("exclude_projects", []))
-        repos = [r for r in repos if r.name not in excluded]
+        repos = [r for r in repos
+                 if r.name not in self._exclude_names and not self._should_exclude(r)]
         
-        return repos
+        return sorted(repos)
     
     def _should_exclude(self, path: Path) -> bool:
         """Check if path should be excluded."""
-        path_str = str(path)
-        for pattern in self.config.get("exclude_patterns", []):
-            if pattern.replace("**/", "").replace("/**", "") in path_str:
-                return True
-        return False
+        return self._exclude_re is not None and bool(self._exclude_re.search(str(path)))
+    
+    def _collect_commits(self, repos: List[Path], since_date: str, until_date: Optional[str] = None,
+                         max_commits: Optional[int] = None) -> List[Dict]:
+        """Get commits for all repos (git log is subprocess-bound, so fan out across threads)."""
+        all_commits = []
+        if not repos:
+            return all_commits
+        
+        commits_by_repo = {}
+        with ThreadPoolExecutor(max_workers=min(32, len(repos))) as executor:
+            futures = {
+                executor.submit(self.get_git_commits, repo, since_date, until_date, max_commits): repo
+                for repo in repos
+            }
+            for future in as_completed(futures):
+                commits_by_repo[futures[future]] = future.result()
+        
+        # Keep discovery order so output is stable between runs
+        for repo in repos:
+            all_commits.extend(commits_by_repo[repo])
+        
+        return all_commits
     
     def generate_journal(self, target_date: str, end_date: Optional[str] = None) -> str:
         """Generate the complete journal entry."""
@@ -626,36 +1165,115 @@ Write the journal entry now:"""
         print(f"✅ Found {len(repos)} git repositories")
         
         # Get commits
-        all_commits = []
-        for repo in repos:
-            commits = self.get_git_commits(repo, target_date, end_date)
-            all_commits.extend(commits)
+        all_commits = self._collect_commits(repos, target_date, end_date)
+        print(f"✅ Found {len(all_commits)} commits")
         
+        return self.generate_for_preloaded(target_date, all_commits)
+    
+    def _collect_range_commits(self, start_date: str, end_date: str) -> Dict[str, List[Dict]]:
+        """
+        Get commits for a date range, bucketed by day.
+        Repos are discovered once and each repo is logged once for the whole range.
+        """
+        repos = self.find_git_repos()
+        print(f"✅ Found {len(repos)} git repositories")
+        
+        # Scale the per-repo cap so a long range isn't starved by one busy day
+        max_commits = self.config.get("max_commits_per_repo", 50)
+        if max_commits:
+            max_commits *= (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+        
+        all_commits = self._collect_commits(repos, start_date, end_date, max_commits)
         print(f"✅ Found {len(all_commits)} commits")
         
+        # Bucket by local committer day: --since/--until filter on committer time, so
+        # author dates (rebased, amended, cherry-picked commits) can fall outside the range
+        commits_by_day: Dict[str, List[Dict]] = defaultdict(list)
+        for commit in all_commits:
+            commits_by_day[date.fromtimestamp(commit['commit_time']).isoformat()].append(commit)
+        
+        return commits_by_day
+    
+    async def generate_range_async(self, start_date: str, end_date: str) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Generate one journal entry per day in a date range.
+        Local data is gathered day by day, then the AI calls run concurrently
+        (bounded by ai_concurrency to respect provider rate limits).
+        Returns the journals that were generated and the dates that failed.
+        """
+        print(f"\n📝 Generating AI-powered journals for {start_date} to {end_date}")
+        
+        commits_by_day = self._collect_range_commits(start_date, end_date)
+        
+        days = []
+        current = datetime.fromisoformat(start_date)
+        end = datetime.fromisoformat(end_date)
+        while current <= end:
+            date_str = current.strftime("%Y-%m-%d")
+            print(f"\n📅 Collecting activity for {date_str}")
+            days.append((date_str, commits_by_day.get(date_str, []), self._collect_day_activity(date_str)))
+            current += timedelta(days=1)
+        
+        semaphore = asyncio.Semaphore(self.config.get("ai_concurrency", 4))
+        
+        async def generate_day(date_str: str, commits: List[Dict], activity: Dict) -> str:
+            async with semaphore:
+                return await self.generate_ai_journal_entry_async(date_str, commits, **activity)
+        
+        print(f"\n🤖 Generating {len(days)} natural language journal entries...")
+        # One failed (e.g. rate-limited) day shouldn't cost the rest of the range
+        entries = await asyncio.gather(*(generate_day(*day) for day in days), return_exceptions=True)
+        
+        journals = {}
+        failed = []
+        for (date_str, commits, activity), entry in zip(days, entries):
+            if isinstance(entry, Exception):
+                print(f"⚠️  Journal generation failed for {date_str}: {entry}")
+                failed.append(date_str)
+                continue
+            journals[date_str] = self._format_journal(date_str, entry, commits,
+                                                      activity['plans'], activity['cursor_activity'])
+        
+        return journals, failed
+    
+    def _collect_day_activity(self, target_date: str) -> Dict:
+        """Gather the non-git activity (Cursor and Claude Code) for a day."""
+        # Parse the date once and share it with every helper
+        target_dt = datetime.fromisoformat(target_date)
+        
         # Get Cursor data
-        plans = self.get_cursor_plans(target_date)
+        plans = self.get_cursor_plans(target_date, target_dt)
         print(f"✅ Found {len(plans)} Cursor plans")
         
-        cursor_activity = self.get_cursor_activity(target_date)
+        cursor_activity = self.get_cursor_activity(target_date, target_dt)
         print(f"✅ Analyzed Cursor activity")
         
         # Get Claude Code data
-        claude_conversations = self.get_claude_code_conversations(target_date)
-        claude_todos = self.get_claude_code_todos(target_date)
-        claude_plans = self.get_claude_code_plans(target_date)
+        claude_conversations = self.get_claude_code_conversations(target_date, target_dt)
+        claude_todos = self.get_claude_code_todos(target_date, target_dt)
+        claude_plans = self.get_claude_code_plans(target_date, target_dt)
         if claude_conversations or claude_todos or claude_plans:
             print(f"✅ Found Claude Code data: {len(claude_conversations)} conversations, {len(claude_todos)} todos, {len(claude_plans)} plans")
         
+        return {
+            'plans': plans,
+            'cursor_activity': cursor_activity,
+            'claude_conversations': claude_conversations,
+            'claude_todos': claude_todos,
+            'claude_plans': claude_plans
+        }
+    
+    def generate_for_preloaded(self, target_date: str, commits: List[Dict]) -> str:
+        """Generate the journal entry for a day whose commits were already collected."""
+        activity = self._collect_day_activity(target_date)
+        
         # Generate AI journal entry
         print("🤖 Generating natural language journal entry...")
-        journal_entry = self.generate_ai_journal_entry(
-            target_date, all_commits, plans, cursor_activity,
-            claude_conversations, claude_todos, claude_plans
-        )
+        journal_entry = self.generate_ai_journal_entry(target_date, commits, **activity)
         
         # Format final output
-        return self._format_journal(target_date, journal_entry, all_commits, plans, cursor_activity)
+        return self._format_journal(target_date, journal_entry, commits,
+                                    activity['plans'], activity['cursor_activity'])
     
     def _format_journal(self, target_date: str, journal_entry: str, 
                         commits: List[Dict], plans: List[Dict], 
@@ -734,15 +1352,14 @@ def main():
         generator = AIJournalGenerator(args.config)
         
         if args.start and args.end:
-            # For date ranges, generate for each day
-            start = datetime.strptime(args.start, "%Y-%m-%d")
-            end = datetime.strptime(args.end, "%Y-%m-%d")
-            current = start
-            while current <= end:
-                date_str = current.strftime("%Y-%m-%d")
-                journal = generator.generate_journal(date_str)
+            # For date ranges, generate one entry per day from a single git pass,
+            # with the per-day AI calls running concurrently
+            journals, failed = asyncio.run(generator.generate_range_async(args.start, args.end))
+            for date_str, journal in journals.items():
                 generator.save_journal(journal, date_str)
-                current += timedelta(days=1)
+            if failed:
+                print(f"❌ Failed to generate journals for: {', '.join(failed)}", file=sys.stderr)
+                sys.exit(1)
         else:
             journal = generator.generate_journal(args.date)
             generator.save_journal(journal, args.date)
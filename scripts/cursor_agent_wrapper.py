@@ -42,7 +42,7 @@ def generate_cursor_context(target_date: str = None) -> dict:
         "summary_preview": summary[:1000],  # First 1000 chars
         "full_summary_available": True,
         "workspace_root": str(generator.workspace_root),
-        "repositories_analyzed": len(generator.find_git_repos())
+        "repositories_analyzed": len(generator.repos)  # Already discovered by generate_summary
     }
     
     return context
@@ -11,13 +11,18 @@ Usage:
     python generate_daily_summary.py [--date YYYY-MM-DD] [--start DATE] [--end DATE]
 """
 
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import re
 
 # Try to import optional dependencies
@@ -32,24 +37,42 @@ try:
 except ImportError:
     HAS_GITPYTHON = False
 
+# Only persist git log results worth re-using (small logs are cheap to re-run)
+GIT_CACHE_MIN_COMMITS = 5
+# Bound on persisted git log entries; the least recently used are evicted first
+GIT_CACHE_MAX_ENTRIES = 200
+
+# Bytes read from the top of each plan file (frontmatter + preview)
+PLAN_HEAD_BYTES = 4096
+
+# One "key: value" line of plan frontmatter
+_FRONT_RE = re.compile(r'^([A-Za-z_][\w-]*)[ \t]*:[ \t]*(.*?)[ \t\r]*$', re.M)
+
+# Project root, resolved once; paths are built from it instead of chdir-ing there
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 class DailyJournalGenerator:
     """Token-optimized daily work summary generator."""
     
     def __init__(self, config_path: str = "config/config.json"):
         """Initialize with configuration."""
-        # Get script directory for relative paths
-        script_dir = Path(__file__).parent.parent
-        os.chdir(script_dir)  # Change to project root
-        
         self.config = self._load_config(config_path)
         self.workspace_root = Path(self.config["workspace_root"]).expanduser()
         
         # Output dir is relative to project root
-        self.output_dir = script_dir / self.config["output_dir"]
-        self.cache_file = script_dir / self.config["cache_file"]
+        self.output_dir = PROJECT_ROOT / self.config["output_dir"]
+        self.cache_file = PROJECT_ROOT / self.config["cache_file"]
         self.cursor_plans_dir = Path(self.config["cursor_plans_dir"])
         
+        # Config value read per repo, looked up once
+        self._max_commits = self.config.get("max_commits_per_repo", 50)
+        
+        # Precompile exclusion patterns into one alternation instead of looping per path
+        exclude_fragments = [pattern.replace("**/", "").replace("/**", "")
+                             for pattern in self.config["exclude_patterns"]]
+        self._exclude_re = re.compile("|".join(map(re.escape, exclude_fragments))) if exclude_fragments else None
+        
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
@@ -57,26 +80,30 @@ class DailyJournalGenerator:
         # Cache for this run
         self._git_cache: Dict[str, List[Dict]] = {}
         self._file_cache: Dict[str, Dict] = {}
+        self._repos: Optional[List[Path]] = None
+        
+        # Persistent cache (last run date + git log results); loaded up front
+        # so the git worker threads all share one dict
+        self._persistent_cache = self._load_persistent_cache()
+        self._persistent_cache_dirty = False
+        self._persistent_cache_lock = threading.Lock()
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file."""
-        # Config path is relative to project root (script_dir)
-        script_dir = Path(__file__).parent.parent
-        config_file = script_dir / config_path
+        # Config path is relative to project root
+        config_file = PROJECT_ROOT / config_path
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
         
         with open(config_file, 'r') as f:
             return json.load(f)
     
-    def _should_exclude(self, path: Path) -> bool:
-        """Check if path should be excluded based on patterns."""
-        path_str = str(path)
-        for pattern in self.config["exclude_patterns"]:
-            # Simple glob-like matching
-            if pattern.replace("**/", "").replace("/**", "") in path_str:
-                return True
-        return False
+    @property
+    def repos(self) -> List[Path]:
+        """Git repositories in the workspace (discovered once per run)."""
+        if self._repos is None:
+            self._repos = self.find_git_repos()
+        return self._repos
     
     def find_git_repos(self) -> List[Path]:
         """
@@ -84,40 +111,42 @@ class DailyJournalGenerator:
         Find all git repositories in workspace.
         """
         repos = []
-        max_depth = 3
+        max_depth = 3 * 2  # .git dirs up to 6 levels below the workspace root
         
         print(f"🔍 Discovering git repositories in {self.workspace_root}...")
         
-        # Use find command (faster than Python walk for large directories)
-        try:
-            result = subprocess.run(
-                ["find", str(self.workspace_root), "-maxdepth", str(max_depth * 2),
-                 "-type", "d", "-name", ".git"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        # Breadth-first scandir walk: scandir's cached d_type avoids an lstat per
+        # entry. The walk keeps descending below a repo, so nested repos and a
+        # workspace root that is itself a repo (e.g. dotfiles in $HOME) all count.
+        # Paths stay plain strings until the survivors are returned.
+        exclude_re = self._exclude_re
+        queue = deque([(str(self.workspace_root), 0)])
+        while queue:
+            dir_path, depth = queue.popleft()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
             
-            for git_dir in result.stdout.strip().split('\n'):
-                if not git_dir:
+            for entry in entries:
+                if entry.name == ".git":
+                    repos.append(dir_path)
                     continue
-                repo_path = Path(git_dir).parent
-                if not self._should_exclude(repo_path):
-                    repos.append(repo_path)
-        
-        except subprocess.TimeoutExpired:
-            print("⚠️  Find command timed out, using Python walk...")
-            # Fallback to Python walk
-            for root, dirs, files in os.walk(self.workspace_root):
-                if '.git' in dirs:
-                    repo_path = Path(root)
-                    if not self._should_exclude(repo_path):
-                        repos.append(repo_path)
-                    dirs[:] = []  # Don't recurse into subdirectories
+                if depth + 1 >= max_depth:
+                    continue
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                # Anything below an excluded path is excluded too, so prune it here
+                if exclude_re is None or not exclude_re.search(entry.path):
+                    queue.append((entry.path, depth + 1))
         
         # Filter excluded projects
         excluded = set(self.config.get("exclude_projects", []))
-        repos = [r for r in repos if r.name not in excluded]
+        repos = sorted(Path(r) for r in repos if os.path.basename(r) not in excluded)
         
         print(f"✅ Found {len(repos)} git repositories")
         return repos
@@ -132,95 +161,166 @@ class DailyJournalGenerator:
             return self._git_cache[cache_key]
         
         try:
-            os.chdir(repo_path)
-            
             # Build git log command
             cmd = [
                 "git", "log",
                 f"--since={since_date} 00:00:00",
                 "--all",
-                "--pretty=format:%h|%an|%ar|%s",
-                "--stat",
+                "--pretty=format:%x00%h%x1f%an%x1f%at%x1f%s",
+                "--name-only",
+                "--no-renames",  # Names only, so skip rename similarity detection
+                "-z",
                 "--no-merges"
             ]
             
             if until_date:
                 cmd.insert(-2, f"--until={until_date} 23:59:59")
             
-            # Limit commits
-            max_commits = self.config.get("max_commits_per_repo", 50)
-            if max_commits:
-                cmd.extend(["-n", str(max_commits)])
+            # Limit commits at the source so git stops walking once the cap is hit
+            if self._max_commits:
+                cmd.append(f"--max-count={self._max_commits}")
             
-            result = subprocess.run(
+            # Reuse results from a previous run if no ref has moved since; the cap
+            # is part of the key so changing max_commits_per_repo invalidates it
+            refs_sha = self._get_refs_sha(repo_path)
+            persistent_key = f"{cache_key}:{self._max_commits}"
+            git_log_cache = self._persistent_cache["git_log"]
+            with self._persistent_cache_lock:
+                cached = git_log_cache.pop(persistent_key, None)
+                if cached is not None:
+                    if refs_sha and cached["head"] == refs_sha:
+                        # Re-insert so dict order tracks recency for eviction
+                        git_log_cache[persistent_key] = cached
+                    else:
+                        # Refs moved, so the entry can never match again
+                        cached = None
+                        self._persistent_cache_dirty = True
+            if cached is not None:
+                commits = [self._with_time_ago(commit) for commit in cached["commits"]]
+                self._git_cache[cache_key] = commits
+                return commits
+            
+            # Stream stdout into the parser instead of buffering the whole log
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=str(repo_path)
             )
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+            
+            timer = threading.Timer(10, kill_on_timeout)
+            timer.start()
+            try:
+                chunks = iter(lambda: proc.stdout.read(65536), b'')
+                commits = list(self._parse_git_log_stream(chunks))
+                proc.wait()
+            finally:
+                timer.cancel()
+                proc.stdout.close()
             
-            if result.returncode != 0:
+            if timed_out.is_set():
+                print(f"⚠️  git log timed out after 10s for {repo_path}")
+                return []
+            if proc.returncode != 0:
                 return []
             
-            commits = self._parse_git_log(result.stdout)
             self._git_cache[cache_key] = commits
+            if refs_sha and len(commits) >= GIT_CACHE_MIN_COMMITS:
+                with self._persistent_cache_lock:
+                    git_log_cache[persistent_key] = {"head": refs_sha, "commits": commits}
+                    while len(git_log_cache) > GIT_CACHE_MAX_ENTRIES:
+                        del git_log_cache[next(iter(git_log_cache))]
+                    self._persistent_cache_dirty = True
             return commits
         
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+        except (OSError, subprocess.SubprocessError) as e:
+            # Failing to start git at all (timeouts are handled by the timer above)
             print(f"⚠️  Error getting git log for {repo_path}: {e}")
             return []
         except Exception as e:
             print(f"⚠️  Unexpected error for {repo_path}: {e}")
             return []
-        finally:
-            os.chdir(self.workspace_root)
     
-    def _parse_git_log(self, log_output: str) -> List[Dict]:
-        """Parse git log output into structured data."""
-        commits = []
+    def _get_refs_sha(self, repo_path: Path) -> Optional[str]:
+        """Fingerprint all refs (git log walks --all, so HEAD alone can miss new commits)."""
+        try:
+            result = subprocess.run(
+                ["git", "show-ref", "--head"],
+                capture_output=True,
+                timeout=5,
+                cwd=str(repo_path)
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if not result.stdout:
+            return None
+        return hashlib.sha1(result.stdout).hexdigest()
+    
+    def _with_time_ago(self, commit: Dict) -> Dict:
+        """Set a git-style relative time ("3 hours ago") from the commit timestamp."""
+        seconds = max(0, int(time.time()) - commit['timestamp'])
+        for limit, unit, size in ((90, "second", 1), (90 * 60, "minute", 60),
+                                  (36 * 3600, "hour", 3600), (14 * 86400, "day", 86400),
+                                  (70 * 86400, "week", 7 * 86400), (365 * 86400, "month", 30 * 86400)):
+            if seconds < limit:
+                break
+        else:
+            unit, size = "year", 365 * 86400
+        count = round(seconds / size)
+        commit['time_ago'] = f"{count} {unit}{'' if count == 1 else 's'} ago"
+        return commit
+    
+    def _parse_git_log_stream(self, chunks: Iterable[bytes]) -> Iterator[Dict]:
+        """
+        Incrementally parse `git log --name-only -z` output, yielding each commit once complete.
+        Every token is NUL-terminated: a header (hash, author, unix time, message
+        split by 0x1f) starts each commit, followed by its file paths.
+        Splitting happens on raw bytes; each token is decoded as UTF-8 on its own.
+        """
+        def tokens() -> Iterator[str]:
+            # Tokens can straddle chunk boundaries, so carry the unterminated tail over
+            pending = b''
+            for chunk in chunks:
+                *complete, pending = (pending + chunk).split(b'\x00')
+                for token in complete:
+                    yield token.decode('utf-8', 'replace')
+            yield pending.decode('utf-8', 'replace')
+        
         current_commit = None
-        current_files = []
         
-        for line in log_output.split('\n'):
-            if not line.strip():
-                if current_commit:
-                    current_commit['files'] = current_files
-                    commits.append(current_commit)
-                    current_commit = None
-                    current_files = []
+        for token in tokens():
+            if not token:
                 continue
             
-            # Commit header: hash|author|time|message
-            if '|' in line and not line.startswith(' '):
-                parts = line.split('|', 3)
-                if len(parts) >= 4:
-                    current_commit = {
-                        'hash': parts[0],
-                        'author': parts[1],
-                        'time_ago': parts[2],
-                        'message': parts[3],
-                        'files': []
-                    }
-                    current_files = []
+            if '\x1f' in token:
+                # The first path follows the header on the same token after a newline
+                header, _, first_file = token.partition('\n')
+                parts = header.split('\x1f', 3)
+                if len(parts) < 4:
+                    continue
+                if current_commit:
+                    yield current_commit
+                current_commit = self._with_time_ago({
+                    'hash': parts[0],
+                    'author': parts[1],
+                    'timestamp': int(parts[2]),
+                    'message': parts[3],
+                    'files': []
+                })
+                if first_file:
+                    current_commit['files'].append({'file': first_file})
             
-            # File stat line: " file.py | 10 +5 -3"
-            elif line.strip().startswith('|') or '|' in line:
-                # Parse file change line
-                match = re.match(r'\s*([^|]+)\s*\|\s*(\d+)\s*([+-]?\d+)\s*([+-]?\d+)?', line)
-                if match:
-                    filename = match.group(1).strip()
-                    changes = match.group(2)
-                    current_files.append({
-                        'file': filename,
-                        'changes': changes
-                    })
+            elif current_commit:
+                current_commit['files'].append({'file': token})
         
         # Don't forget the last commit
         if current_commit:
-            current_commit['files'] = current_files
-            commits.append(current_commit)
-        
-        return commits
+            yield current_commit
     
     def get_cursor_plans(self, target_date: str) -> List[Dict]:
         """
@@ -235,29 +335,33 @@ class DailyJournalGenerator:
         plans = []
         
         try:
-            # Find plan files modified on target date
+            # Find plan files modified on target date (find filters by mtime itself)
+            next_date = (datetime.strptime(target_date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
             result = subprocess.run(
-                ["find", str(plans_dir), "-type", "f", "-name", "*.plan.md", "-mtime", "-1"],
+                ["find", str(plans_dir), "-type", "f", "-name", "*.plan.md",
+                 "-newermt", target_date, "!", "-newermt", next_date, "-print0"],
                 capture_output=True,
-                text=True,
                 timeout=10
             )
             
-            for plan_file in result.stdout.strip().split('\n'):
+            for plan_file in result.stdout.split(b'\x00'):
                 if not plan_file:
                     continue
                 
-                plan_path = Path(plan_file)
+                plan_path = Path(os.fsdecode(plan_file))
                 if plan_path.exists():
                     try:
-                        content = plan_path.read_text()
+                        # Only the head is needed, so skip reading long plans in full
+                        with plan_path.open('rb') as f:
+                            head = f.read(PLAN_HEAD_BYTES)
                         # Extract metadata from frontmatter
-                        metadata = self._parse_plan_frontmatter(content)
+                        metadata = self._parse_plan_frontmatter(head)
                         plans.append({
                             'file': plan_path.name,
                             'path': str(plan_path),
                             'metadata': metadata,
-                            'content_preview': content[:500]  # First 500 chars
+                            # First 500 bytes; 'ignore' drops a character cut in half at the end
+                            'content_preview': head[:500].decode('utf-8', errors='ignore')
                         })
                     except Exception as e:
                         print(f"⚠️  Error reading plan {plan_path}: {e}")
@@ -269,23 +373,20 @@ class DailyJournalGenerator:
         
         return plans
     
-    def _parse_plan_frontmatter(self, content: str) -> Dict:
-        """Parse YAML frontmatter from plan file."""
-        metadata = {}
-        
-        if content.startswith('---'):
-            # Extract frontmatter
-            end_idx = content.find('---', 3)
-            if end_idx > 0:
-                frontmatter = content[3:end_idx].strip()
-                for line in frontmatter.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        metadata[key] = value
-        
-        return metadata
+    def _parse_plan_frontmatter(self, content: bytes) -> Dict:
+        """Parse YAML frontmatter from the raw head of a plan file."""
+        if not content.startswith(b'---'):
+            return {}
+        
+        end_idx = content.find(b'---', 3)
+        if end_idx < 0:
+            # Frontmatter runs past the head we read (long todo lists); parse what
+            # is there, minus the last line, which may be cut off mid-value
+            end_idx = content.rfind(b'\n')
+        
+        # Decode just the frontmatter slice, then scan it with one regex
+        frontmatter = content[3:end_idx].decode('utf-8', errors='replace')
+        return {m.group(1): m.group(2).strip('"\'') for m in _FRONT_RE.finditer(frontmatter)}
     
     def get_file_modifications(self, repo_path: Path, target_date: str) -> List[Dict]:
         """
@@ -296,67 +397,90 @@ class DailyJournalGenerator:
         # This is expensive, so we use it sparingly
         
         try:
-            os.chdir(repo_path)
-            
-            # Check for uncommitted changes
+            # Check for uncommitted changes (-z: NUL-terminated, paths unquoted)
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "status", "--porcelain=v1", "-z"],
                 capture_output=True,
-                text=True,
-                timeout=5
+                timeout=5,
+                cwd=str(repo_path)
             )
             
-            if result.returncode == 0 and result.stdout.strip():
+            if result.returncode == 0 and result.stdout:
                 # Has uncommitted changes, check modification times
+                target = datetime.strptime(target_date, "%Y-%m-%d").date()
                 modified_files = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.startswith(' M') or line.startswith('??'):
-                        file_path = line[3:].strip()
-                        full_path = repo_path / file_path
-                        if full_path.exists():
-                            mtime = datetime.fromtimestamp(full_path.stat().st_mtime)
-                            if mtime.date() == datetime.strptime(target_date, "%Y-%m-%d").date():
-                                modified_files.append({
-                                    'file': file_path,
-                                    'status': line[0:2].strip(),
-                                    'modified': mtime.isoformat()
-                                })
+                entries = iter(result.stdout.split(b'\x00'))
+                for entry in entries:
+                    # Paths are decoded like the OS would, so stat() sees the real name
+                    status, file_path = entry[:2].decode('ascii', 'replace'), os.fsdecode(entry[3:])
+                    if status[:1] in ('R', 'C'):
+                        # Renames/copies are followed by an extra entry for the original path
+                        next(entries, None)
+                    if status == ' M' or status == '??':
+                        # One stat call doubles as the existence check
+                        try:
+                            st = os.stat(repo_path / file_path)
+                        except FileNotFoundError:
+                            continue
+                        mtime = datetime.fromtimestamp(st.st_mtime)
+                        if mtime.date() == target:
+                            modified_files.append({
+                                'file': file_path,
+                                'status': status.strip(),
+                                'modified': mtime.isoformat()
+                            })
                 
                 return modified_files
         
         except Exception as e:
             print(f"⚠️  Error checking file modifications for {repo_path}: {e}")
-        finally:
-            os.chdir(self.workspace_root)
         
         return []
     
+    def _analyze_repo(self, repo: Path, target_date: str, end_date: Optional[str]) -> Optional[Dict]:
+        """
+        Run every git query for one repo in a single worker task, so a pool thread
+        handles the repo end to end instead of once per phase.
+        """
+        commits = self.get_git_commits(repo, target_date, end_date)
+        if not commits:
+            return None
+        
+        data = {
+            'commits': commits,
+            'path': str(repo.relative_to(self.workspace_root))
+        }
+        
+        # File modifications (only for repos with commits)
+        file_mods = self.get_file_modifications(repo, target_date)
+        if file_mods:
+            data['file_modifications'] = file_mods
+        
+        return data
+    
     def generate_summary(self, target_date: str, end_date: Optional[str] = None) -> str:
         """Generate the daily summary markdown."""
         print(f"\n📝 Generating summary for {target_date}" + (f" to {end_date}" if end_date else ""))
         
         # Phase 1: Discovery
-        repos = self.find_git_repos()
+        repos = self.repos
         
-        # Phase 2: Git Analysis (batch all queries)
+        # Phases 2 + 4: Git analysis and uncommitted changes, one pooled task per repo
         repo_data = {}
-        for repo in repos:
-            commits = self.get_git_commits(repo, target_date, end_date)
-            if commits:
-                repo_data[repo] = {
-                    'commits': commits,
-                    'path': str(repo.relative_to(self.workspace_root))
-                }
+        if repos:
+            with ThreadPoolExecutor(max_workers=min(32, len(repos))) as executor:
+                results = executor.map(
+                    lambda repo: self._analyze_repo(repo, target_date, end_date), repos
+                )
+                for repo, data in zip(repos, results):
+                    if data:
+                        repo_data[repo] = data
+        
+        self.save_cache()
         
         # Phase 3: Cursor Plans
         plans = self.get_cursor_plans(target_date)
         
-        # Phase 4: File modifications (only for repos with commits)
-        for repo, data in repo_data.items():
-            file_mods = self.get_file_modifications(repo, target_date)
-            if file_mods:
-                data['file_modifications'] = file_mods
-        
         # Generate markdown
         return self._format_summary(target_date, end_date, repo_data, plans)
     
@@ -364,12 +488,13 @@ class DailyJournalGenerator:
                        repo_data: Dict, plans: List[Dict]) -> str:
         """Format the summary as markdown."""
         date_range = f"{target_date}" + (f" to {end_date}" if end_date else "")
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        md = f"# Today's Work Summary - {date_range}\n\n"
-        md += f"## Overview\n\n"
-        md += f"Work summary generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}.\n"
-        md += f"Analyzed {len(repo_data)} repositories with activity.\n\n"
-        md += "---\n\n"
+        parts = [f"# Today's Work Summary - {date_range}\n\n"]
+        parts.append(f"## Overview\n\n")
+        parts.append(f"Work summary generated on {now_str}.\n")
+        parts.append(f"Analyzed {len(repo_data)} repositories with activity.\n\n")
+        parts.append("---\n\n")
         
         # Projects section
         for repo, data in repo_data.items():
@@ -377,53 +502,56 @@ class DailyJournalGenerator:
             repo_path = data['path']
             commits = data['commits']
             
-            md += f"## Project: {repo_name}\n"
-            md += f"**Location:** `{repo_path}`\n\n"
+            parts.append(f"## Project: {repo_name}\n")
+            parts.append(f"**Location:** `{repo_path}`\n\n")
             
             # Group commits by feature/task (simple heuristic: group by first few words)
-            md += "### Work Completed\n\n"
+            parts.append("### Work Completed\n\n")
             
             for commit in commits:
-                md += f"#### {commit['message']}\n"
-                md += f"**Commit:** `{commit['hash']}` - {commit['author']}, {commit['time_ago']}\n\n"
+                parts.append(f"#### {commit['message']}\n")
+                parts.append(f"**Commit:** `{commit['hash']}` - {commit['author']}, {commit['time_ago']}\n\n")
                 
                 if commit['files']:
-                    md += "**Files Changed:**\n"
+                    parts.append("**Files Changed:**\n")
                     for file_info in commit['files'][:10]:  # Limit to 10 files
-                        md += f"- `{file_info['file']}` ({file_info['changes']} changes)\n"
+                        if 'changes' in file_info:
+                            parts.append(f"- `{file_info['file']}` ({file_info['changes']} changes)\n")
+                        else:
+                            parts.append(f"- `{file_info['file']}`\n")
                     if len(commit['files']) > 10:
-                        md += f"- ... and {len(commit['files']) - 10} more files\n"
-                    md += "\n"
+                        parts.append(f"- ... and {len(commit['files']) - 10} more files\n")
+                    parts.append("\n")
             
             # File modifications (uncommitted)
             if 'file_modifications' in data and data['file_modifications']:
-                md += "### Uncommitted Changes\n\n"
+                parts.append("### Uncommitted Changes\n\n")
                 for file_mod in data['file_modifications']:
-                    md += f"- `{file_mod['file']}` ({file_mod['status']})\n"
-                md += "\n"
+                    parts.append(f"- `{file_mod['file']}` ({file_mod['status']})\n")
+                parts.append("\n")
             
-            md += "---\n\n"
+            parts.append("---\n\n")
         
         # Cursor Plans section
         if plans:
-            md += "## Cursor Plans\n\n"
+            parts.append("## Cursor Plans\n\n")
             for plan in plans:
-                md += f"### {plan['metadata'].get('name', plan['file'])}\n"
-                md += f"**File:** `{plan['file']}`\n\n"
+                parts.append(f"### {plan['metadata'].get('name', plan['file'])}\n")
+                parts.append(f"**File:** `{plan['file']}`\n\n")
                 if 'overview' in plan['metadata']:
-                    md += f"**Overview:** {plan['metadata']['overview']}\n\n"
-            md += "---\n\n"
+                    parts.append(f"**Overview:** {plan['metadata']['overview']}\n\n")
+            parts.append("---\n\n")
         
         # Statistics
-        md += "## Summary Statistics\n\n"
+        parts.append("## Summary Statistics\n\n")
         total_commits = sum(len(data['commits']) for data in repo_data.values())
-        md += f"- **Total Repositories:** {len(repo_data)}\n"
-        md += f"- **Total Commits:** {total_commits}\n"
-        md += f"- **Cursor Plans:** {len(plans)}\n\n"
+        parts.append(f"- **Total Repositories:** {len(repo_data)}\n")
+        parts.append(f"- **Total Commits:** {total_commits}\n")
+        parts.append(f"- **Cursor Plans:** {len(plans)}\n\n")
         
-        md += f"\n*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        parts.append(f"\n*Generated: {now_str}*\n")
         
-        return md
+        return "".join(parts)
     
     def save_summary(self, summary: str, target_date: str) -> Path:
         """Save summary to file."""
@@ -432,15 +560,36 @@ class DailyJournalGenerator:
         print(f"✅ Summary saved to {output_file}")
         return output_file
     
+    def _load_persistent_cache(self) -> Dict:
+        """Load the cache file ({"last_run": date, "git_log": {key: {"head", "commits"}}})."""
+        cache = {}
+        if self.cache_file.exists():
+            content = self.cache_file.read_text().strip()
+            try:
+                cache = json.loads(content)
+            except json.JSONDecodeError:
+                # Older versions stored just the last run date as plain text
+                cache = {"last_run": content}
+            if not isinstance(cache, dict):
+                cache = {}
+        cache.setdefault("git_log", {})
+        return cache
+    
+    def save_cache(self):
+        """Write the cache file if anything changed."""
+        if self._persistent_cache_dirty:
+            self.cache_file.write_text(json.dumps(self._persistent_cache))
+            self._persistent_cache_dirty = False
+    
     def update_cache(self, target_date: str):
         """Update cache with last run timestamp."""
-        self.cache_file.write_text(target_date)
+        self._persistent_cache["last_run"] = target_date
+        self._persistent_cache_dirty = True
+        self.save_cache()
     
     def get_last_run_date(self) -> Optional[str]:
         """Get the last run date from cache."""
-        if self.cache_file.exists():
-            return self.cache_file.read_text().strip()
-        return None
+        return self._persistent_cache.get("last_run")
 
 
 def main():